@@ -2,10 +2,12 @@ import functools
 import sys
 import json
 import time
+import random
 import re
 import logging
 import threading
-from multiprocessing.pool import ThreadPool
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 from graphite_api.intervals import Interval, IntervalSet
 from graphite_api.node import LeafNode, BranchNode, Node
@@ -22,90 +24,240 @@ URLLENGTH = 2048 - 300
 # Default cache timeout for the list of metric paths
 DEFAULT_METRICS_CACHE_EXPIRY = 300
 
+# How long identical fetch_multi requests share one result (seconds), so
+# concurrent viewers of the same dashboard collapse into a single fetch
+FETCH_CACHE_TTL = 5
+FETCH_CACHE_MAXSIZE = 256
+
 log = logging.getLogger(__name__)
 
-pool = ThreadPool(processes=4)
+pool = ThreadPoolExecutor(max_workers=8)
 request_session_cache = threading.local()
 
 
-def chunk(nodelist, length):
-    """Splits lists of nodes so that they fit within url limits"""
-    chunklist = []
+def get_session():
+    """Thread-local requests session, so connections to Metronome are kept
+    alive instead of paying a TCP+TLS handshake on every request"""
+    session = getattr(request_session_cache, 'session', None)
+    if session is None:
+        session = requests.session()
+        # Larger connection pool so chunked parallel fetches do not
+        # queue waiting for a free connection
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        request_session_cache.session = session
+    return session
+
+
+def chunk(paths, length):
+    """Splits a list of metric paths so that they fit within url limits.
+
+    Yields slices of the input list instead of building new per-path
+    lists; only the running byte total is tracked per path.
+    """
+    start = 0
     linelength = 0
-    for node in nodelist:
-        # the magic number 1 is because the nodes list is joined with ','
-        nodelength = len(str(node)) + 1
-
-        if linelength + nodelength > length:
-            yield chunklist
-            chunklist = [node]
-            linelength = nodelength
+    for i, path in enumerate(paths):
+        # the magic number 1 is because the paths list is joined with ','
+        pathlength = len(path) + 1
+
+        if linelength + pathlength > length and i > start:
+            yield paths[start:i]
+            start = i
+            linelength = pathlength
         else:
-            chunklist.append(node)
-            linelength += nodelength
+            linelength += pathlength
+
+    if start < len(paths):
+        yield paths[start:]
+
+
+# Fixes the broken JSON inside Metronome JSONP in a single pass
+_r_jsonp_fix = re.compile(rb' (derivative|raw): ')
 
-    if chunklist:
-        yield chunklist
 
+def read_response_body(resp):
+    """Read a streamed response into a single bytearray.
 
-def load_jsonp(s):
-    """Metronome always returns JSONP with invalid JSON inside"""
-    #log.debug('JSONP data |%s|', s)
+    Avoids the list-of-chunks plus final join that resp.content builds
+    internally, roughly halving peak memory for large bodies.
+    """
+    body = bytearray()
+    for part in resp.iter_content(chunk_size=65536):
+        body += part
+    return body
+
+
+def load_jsonp(buf):
+    """Metronome always returns JSONP with invalid JSON inside.
+
+    Takes the raw response body as bytes to avoid decoding the whole
+    response to a str first.
+    """
+    #log.debug('JSONP data |%s|', buf)
     # Strip '_(' and ');'
-    raw = s[2:-2]
+    raw = buf[2:-2]
     # Fix broken JSON
-    raw = raw.replace(' derivative: ', ' "derivative":') \
-             .replace(' raw: ', ' "raw":')
+    raw = _r_jsonp_fix.sub(rb' "\1": ', raw)
 
     try:
         data = json.loads(raw)
     except ValueError:
-        log.error('Invalid JSONP:\n%s', s)
+        log.error('Invalid JSONP:\n%s', buf)
         raise
     return data
 
 
 def log_call(func):
-    """Decorator to log calls to functions"""
+    """Decorator to log calls to functions.
+
+    When debug logging is off, the function is returned undecorated so
+    there is zero per-call overhead.
+    """
+    if not log.isEnabledFor(logging.DEBUG):
+        return func
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         t0 = time.time()
         result = func(*args, **kwargs)
         t1 = time.time()
-        log.debug('Call to %s took %.3fs', func.func_name, t1 - t0)
+        log.debug('Call to %s took %.3fs', func.__name__, t1 - t0)
         return result
     return wrapper
 
 
+def _expand_alternations(segment):
+    """Expand '{a,b}' alternation groups in a path segment into a list of
+    plain glob strings, e.g. 'x{a,b}' -> ['xa', 'xb']"""
+    alternatives = ['']
+    i = 0
+    while i < len(segment):
+        c = segment[i]
+        end = segment.find('}', i) if c == '{' else -1
+        if end >= 0:
+            group = segment[i + 1:end].split(',')
+            alternatives = [ a + g for a in alternatives for g in group ]
+            i = end + 1
+        else:
+            alternatives = [ a + c for a in alternatives ]
+            i += 1
+    return alternatives
+
+
+def _glob_match(pattern, candidate):
+    """Match a single segment glob (only '*' wildcards, no dots) against a
+    string.
+
+    Uses the classic two-pointer wildcard algorithm: a single forward scan
+    with at most one retry position per '*', so matching is linear and never
+    backtracks exponentially like a regex NFA can.
+    """
+    pi = ci = 0
+    star = -1
+    mark = 0
+    plen = len(pattern)
+    clen = len(candidate)
+    while ci < clen:
+        if pi < plen and (pattern[pi] == candidate[ci]):
+            pi += 1
+            ci += 1
+        elif pi < plen and pattern[pi] == '*':
+            star = pi
+            mark = ci
+            pi += 1
+        elif star >= 0:
+            pi = star + 1
+            mark += 1
+            ci = mark
+        else:
+            return False
+    while pi < plen and pattern[pi] == '*':
+        pi += 1
+    return pi == plen
+
+
+def _compile_segment_glob(pattern):
+    """Specialize a single-segment glob into a fast matcher function.
+
+    The common shapes (literal, bare '*', single-'*' prefix/suffix) become
+    direct string operations; only mixed patterns with multiple wildcards
+    fall back to the generic scan.
+    """
+    if '*' not in pattern:
+        return pattern.__eq__
+
+    if pattern == '*':
+        return lambda segment: True
+
+    head, _, tail = pattern.partition('*')
+    if '*' not in tail:
+        minlength = len(head) + len(tail)
+        def match(segment):
+            return (len(segment) >= minlength
+                    and segment.startswith(head)
+                    and segment.endswith(tail))
+        return match
+
+    return functools.partial(_glob_match, pattern)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_segment(segment):
+    """Compile a single query path segment, shared across all Matchers.
+
+    Distinct queries mostly consist of the same segments ('*', literal
+    names), so each distinct segment is expanded and specialized once
+    for the whole process.
+
+    Returns (alternatives, matchers, literals): the expanded glob
+    alternatives, a matcher function per alternative, and the set of
+    alternatives when all of them are literal (None otherwise).
+    """
+    alternatives = _expand_alternations(segment)
+    matchers = [ _compile_segment_glob(a) for a in alternatives ]
+    literals = (frozenset(alternatives)
+                if not any( '*' in a for a in alternatives ) else None)
+    return alternatives, matchers, literals
+
+
 class Matcher(object):
     """Tests candidate paths against 'foo.*.{a,b}.latency' query expressions"""
 
+    __slots__ = ('query', 'segments', 'matchers', 'literals')
+
     def __init__(self, query):
         self.query = query
-
-        self.regexp = (
-            # Group captures result
-            '^(?P<path>' +
-            query.replace('.', r'\.').replace('$', r'\$')
-                 # '{a,b}' -> /(a|b)/
-                 .replace('{', '(').replace('}', ')').replace(',', '|')
-                 # '*' -> /[^.]*/
-                 .replace('*', r'[^.]*')
-            # Group captures extra path info if not a leaf node
-            + ')(?P<extra>$|\..+$)'
-        )
-        self.re = re.compile(self.regexp)
-        #log.debug('Matcher regexp: %s', self.regexp)
+        compiled = [ _compile_segment(s) for s in query.split('.') ]
+        # Per path segment: glob alternatives ('{a,b}' expanded), the
+        # compiled matcher per alternative, and the literal set if no
+        # alternative contains a wildcard
+        self.segments = [ c[0] for c in compiled ]
+        self.matchers = [ c[1] for c in compiled ]
+        self.literals = [ c[2] for c in compiled ]
 
     def match(self, candidate_path):
         # Returns: (path, is_leaf_node)
-        m = self.re.match(candidate_path)
-        if m:
-            is_leaf_node = not m.group('extra')
-            return m.group('path'), is_leaf_node
-        else:
+        parts = candidate_path.split('.')
+        n = len(self.segments)
+        if len(parts) < n:
             return None, None
 
+        for matchers, part in zip(self.matchers, parts):
+            if not any( m(part) for m in matchers ):
+                return None, None
+
+        return '.'.join(parts[:n]), len(parts) == n
+
+
+@functools.lru_cache(maxsize=1024)
+def get_matcher(pattern):
+    """Cached Matcher construction: Grafana dashboards repeat the same
+    query patterns on every panel refresh"""
+    return Matcher(pattern)
+
 
 class _LastFetch:
     """Cached last fetch data to handle movingAverage"""
@@ -125,18 +277,59 @@ class MetronomeFinder(object):
 
     __fetch_multi__ = 'metronome'
 
+    __slots__ = (
+        '_metronome_url', '_metrics_cache_expiry', '_tls',
+        '_metrics_cache', '_metrics_cache_set', '_metrics_trie',
+        '_metrics_cache_ts', '_metrics_lock', '_view_to_real',
+        '_fetch_cache', '_fetch_inflight', '_fetch_lock', '_use_post',
+    )
+
     def __init__(self, config=None):
         self._metronome_url = config['metronome']['url']
         self._metrics_cache_expiry = \
             config['metronome'].get('metrics_cache_expiry',
                                     DEFAULT_METRICS_CACHE_EXPIRY)
-
-        # Cache the last data fetch, because the graphite-api first does a
-        # fetch_multi and single fetches for movingAverage.
-        self._last_fetch = _LastFetch()
+        # POST requests are not subject to yahttp's URL length cap, so all
+        # paths fit in a single request. Off by default: it needs a
+        # Metronome that accepts POST for 'do=retrieve'.
+        self._use_post = config['metronome'].get('use_post', False)
+
+        # Per-thread state for the last-fetch cache (see _last_fetch)
+        self._tls = threading.local()
+
+        # Cached list of metric paths, refreshed under _metrics_lock (kept
+        # as instance state so concurrent finders do not share it through
+        # the class)
+        self._metrics_cache = None
+        self._metrics_cache_set = None
+        self._metrics_trie = None
+        self._metrics_cache_ts = 0
+        self._metrics_lock = threading.Lock()
+
+        # Inverse of the view mapping, rebuilt on every cache refresh:
+        # view path -> real metric path
+        self._view_to_real = {}
+
+        # Short-lived fetch_multi result cache with single-flight dedup
+        self._fetch_cache = {}
+        self._fetch_inflight = {}
+        self._fetch_lock = threading.Lock()
 
         log.info('MetronomeFinder initialized: %s', self._metronome_url)
 
+    @property
+    def _last_fetch(self):
+        """Cache of the last data fetch, because the graphite-api first does
+        a fetch_multi and single fetches for movingAverage.
+
+        Kept per thread, so concurrent workers neither race on the shared
+        state nor evict each other's cached fetch.
+        """
+        last = getattr(self._tls, 'last_fetch', None)
+        if last is None:
+            last = self._tls.last_fetch = _LastFetch()
+        return last
+
     def find_nodes(self, query):
         """Find nodes for 'foo.*.{a,b}.latency' query expressions
         :type query: graphite_api.storage.FindQuery
@@ -148,21 +341,22 @@ class MetronomeFinder(object):
             path = query.pattern
             if path in metrics_set:
                 yield MetronomeLeafNode(path, MetronomeReader(path, self))
+            else:
+                # A literal query can still name a branch (tree browsing);
+                # a plain trie descent decides that without any matching
+                node = self._metrics_trie
+                for segment in path.split('.'):
+                    node = node.get(segment)
+                    if node is None:
+                        return
+                yield BranchNode(path)
             return
 
         log.info("find_nodes: %s", query.pattern)
-        matcher = Matcher(query.pattern)
-        seen = set()
-
-        for candidate in metrics:
-            path, is_leaf_node = matcher.match(candidate)
-            if not path:
-                continue
-
-            if path in seen:
-                continue
-            seen.add(path)
+        matcher = get_matcher(query.pattern)
 
+        for path, is_leaf_node in self._walk_trie(
+                self._metrics_trie, matcher, 0, ''):
             #log.debug('match: %s %s', path, is_leaf_node)
 
             if is_leaf_node:
@@ -170,26 +364,90 @@ class MetronomeFinder(object):
             else:
                 yield BranchNode(path)
 
-    _metrics_cache = None
-    _metrics_cache_set = None
-    _metrics_cache_ts = 0
+    def _walk_trie(self, node, matcher, depth, prefix):
+        """Walk the metrics trie along the query segments, descending only
+        into subtrees that match, and yield (path, is_leaf_node) tuples"""
+        literals = matcher.literals[depth]
+        matchers = matcher.matchers[depth]
+        last = depth == len(matcher.segments) - 1
+
+        # All-literal segments descend with dict lookups instead of
+        # matching against every child at this level
+        if literals is not None:
+            candidates = [
+                (segment, node[segment]) for segment in literals
+                if segment in node
+            ]
+        else:
+            candidates = [
+                (segment, child) for segment, child in node.items()
+                if segment is not None and any( m(segment) for m in matchers )
+            ]
+
+        for segment, child in candidates:
+            path = prefix + segment
+            if not last:
+                for result in self._walk_trie(
+                        child, matcher, depth + 1, path + '.'):
+                    yield result
+            elif None in child:
+                yield path, True
+            elif child:
+                yield path, False
+
     def _get_metrics_list(self):
         """Get raw list of all metrics from Metronome"""
+        # Unlocked fast path: a refresh replaces whole objects, so a stale
+        # read here is at worst a consistent, slightly old cache
         if self._metrics_cache_ts + self._metrics_cache_expiry > time.time():
             return self._metrics_cache, self._metrics_cache_set
 
-        resp = requests.get(self._metronome_url,
-                            params=dict(do='get-metrics', callback='_'))
-        data = load_jsonp(resp.text)
-        log.info('Loaded %i metric paths', len(data['metrics']))
-
-        # Extend available metrics with mapped view names
-        self._metrics_cache = self._pdns_map_views(data['metrics'])
-        self._metrics_cache_set = set(self._metrics_cache)
-        self._metrics_cache_ts = time.time()
+        with self._metrics_lock:
+            # Another thread may have refreshed while we waited for the
+            # lock; the re-check makes the refresh single-flight
+            if self._metrics_cache_ts + self._metrics_cache_expiry \
+                    > time.time():
+                return self._metrics_cache, self._metrics_cache_set
+
+            resp = get_session().get(
+                self._metronome_url,
+                params=dict(do='get-metrics', callback='_'),
+                stream=True)
+            data = load_jsonp(read_response_body(resp))
+            log.info('Loaded %i metric paths', len(data['metrics']))
+
+            # Extend available metrics with mapped view names. The paths
+            # are interned so the list, set and trie all share one str
+            # object per path, with its hash computed once.
+            self._metrics_cache = [
+                sys.intern(path)
+                for path in self._pdns_map_views(data['metrics'])
+            ]
+            self._metrics_cache_set = frozenset(self._metrics_cache)
+            self._metrics_trie = self._build_metrics_trie(self._metrics_cache)
+            # Jitter the effective TTL by +-10% so multiple workers do not
+            # all refresh against Metronome at the same moment
+            self._metrics_cache_ts = time.time() + \
+                random.uniform(-0.1, 0.1) * self._metrics_cache_expiry
 
         return self._metrics_cache, self._metrics_cache_set
 
+    def _build_metrics_trie(self, paths):
+        """Build a nested dict of path segments for quick prefix descent.
+
+        A None key marks a node where a complete metric path ends.
+        """
+        trie = {}
+        for path in paths:
+            node = trie
+            for segment in path.split('.'):
+                child = node.get(segment)
+                if child is None:
+                    child = node[segment] = {}
+                node = child
+            node[None] = True
+        return trie
+
     _r_pdns_map_views = re.compile(
         r'^pdns\.(?P<name>.+)\.(?P<type>auth|recursor)\.(?P<extra>.+?)$'
     )
@@ -205,40 +463,56 @@ class MetronomeFinder(object):
 
         This way you can use `_pdns_view.recursor.*` as a Grafana template
         query.
+
+        The time derivative version of each metric ('_dt' suffix, always
+        returned by Metronome) is added in the same pass. This is a
+        generator, so the caller consumes the paths without an
+        intermediate full-size list.
+
+        The inverse mapping is recorded in _view_to_real on the side, so
+        _pdns_unmap_views can translate view paths back with plain dict
+        lookups.
         """
-        view_paths = []
+        match = self._r_pdns_map_views.match
+        view_to_real = self._view_to_real = {}
         for path in paths:
-            view_paths.append(path)
-            m = self._r_pdns_map_views.match(path)
+            yield path
+            yield path + '_dt'
+
+            # Cheap prefix check saves the regex for non-pdns paths
+            if not path.startswith('pdns.'):
+                continue
+
+            m = match(path)
             if m:
-                new_name = m.group('name').replace('.', '--')
-                view = '_pdns_view.{type}.{name}.{type}.{extra}'.format(
-                    type=m.group('type'),
-                    name=new_name,
-                    extra=m.group('extra'))
-                view_paths.append(view)
-
-        # Add time derivative version of metric (always returned by metronome)
-        with_dt = []
-        for path in view_paths:
-            with_dt.append(path)
-            with_dt.append(path + '_dt')
-        return with_dt
+                mtype = m.group('type')
+                name = m.group('name').replace('.', '--')
+                extra = m.group('extra')
+                view = f'_pdns_view.{mtype}.{name}.{mtype}.{extra}'
+                view_to_real[view] = path
+                view_to_real[view + '_dt'] = path + '_dt'
+                yield view
+                yield view + '_dt'
 
     def _pdns_unmap_views(self, paths):
         """Reverse view mapping before fetching data"""
+        view_to_real = self._view_to_real
         unmapped = []
         renames = {}
         for path in paths:
-            if path.startswith('_pdns_view.'):
+            real = view_to_real.get(path)
+            if real is None and path.startswith('_pdns_view.'):
+                # Not in the mapping (e.g. no metrics refresh has happened
+                # in this worker yet); reconstruct the real path
                 p = path.split('.')
-                new_path = 'pdns.{name}.{type}.{extra}'.format(
+                real = 'pdns.{name}.{type}.{extra}'.format(
                     name=p[2].replace('--', '.'),
                     type=p[1],
                     extra='.'.join(p[4:])
                 )
-                renames[new_path] = path
-                unmapped.append(new_path)
+            if real is not None:
+                renames[real] = path
+                unmapped.append(real)
             else:
                 unmapped.append(path)
         return unmapped, renames
@@ -260,6 +534,51 @@ class MetronomeFinder(object):
             if time_info is not None:
                 return time_info, {path: values}
 
+        # Identical requests within FETCH_CACHE_TTL share one result, and
+        # concurrent identical requests share one fetch (single-flight)
+        key = (tuple(sorted( node.path for node in nodes )),
+               start_time, end_time)
+        now = time.time()
+        waiter = None
+        with self._fetch_lock:
+            entry = self._fetch_cache.get(key)
+            if entry is not None and entry[0] > now:
+                # Shallow-copy the path dict so one caller's bookkeeping
+                # cannot corrupt the cached entry
+                time_info, data = entry[1]
+                return time_info, dict(data)
+            waiter = self._fetch_inflight.get(key)
+            if waiter is None:
+                self._fetch_inflight[key] = threading.Event()
+
+        if waiter is not None:
+            waiter.wait()
+            with self._fetch_lock:
+                entry = self._fetch_cache.get(key)
+            if entry is not None:
+                time_info, data = entry[1]
+                return time_info, dict(data)
+            # The other fetch failed; fall through and fetch ourselves
+
+        try:
+            result = self._fetch_multi(nodes, start_time, end_time)
+            with self._fetch_lock:
+                if len(self._fetch_cache) >= FETCH_CACHE_MAXSIZE:
+                    self._fetch_cache = {
+                        k: v for k, v in self._fetch_cache.items()
+                        if v[0] > now
+                    }
+                self._fetch_cache[key] = (now + FETCH_CACHE_TTL, result)
+        finally:
+            with self._fetch_lock:
+                event = self._fetch_inflight.pop(key, None)
+            if event is not None:
+                event.set()
+
+        time_info, data = result
+        return time_info, dict(data)
+
+    def _fetch_multi(self, nodes, start_time, end_time):
         # Rename view paths to real metric paths for querying
         paths, renames = self._pdns_unmap_views([ node.path for node in nodes ])
 
@@ -269,10 +588,11 @@ class MetronomeFinder(object):
         #log.warn("@@@@ %s", request)
 
         # FIXME: can we get the requested number?
-        points = min(720, (end_time - start_time) / 10)
-        start_time = start_time
-        end_time = end_time
-        step = (end_time - start_time) / points
+        # Integer arithmetic: 'datapoints' ends up in the request URL (a
+        # float there defeats any backend caching), and a degenerate time
+        # range must not divide by zero
+        points = max(1, min(720, int(end_time - start_time) // 10))
+        step = max(1, int(end_time - start_time) // points)
         time_info = start_time, end_time, step
 
         # Request extra data for movingAverage() that will be cached
@@ -293,10 +613,20 @@ class MetronomeFinder(object):
                 log.exception('Exception in do_retrieve')
                 raise
 
-        # These are executed in parallel with a thread pool
+        if self._use_post:
+            # The whole request goes into the POST body; no need to chunk
+            chunks = [paths]
+        else:
+            chunks = list(chunk(paths, URLLENGTH))
+
         ext_data = {}
-        for series in pool.map(do_retrieve, chunk(paths, URLLENGTH)):
-            ext_data.update(series)
+        if len(chunks) == 1:
+            # Common case: a single request, no pool dispatch overhead
+            ext_data.update(do_retrieve(chunks[0]))
+        else:
+            # Multiple chunks are executed in parallel with a thread pool
+            for series in pool.map(do_retrieve, chunks):
+                ext_data.update(series)
 
         # Restore view names for the result
         for old, new in renames.items():
@@ -322,6 +652,27 @@ class MetronomeFinder(object):
 
         return time_info, data
 
+    def _fetch_one(self, path, start_time, end_time):
+        """Fetch data for a single path, used by MetronomeReader.fetch.
+
+        Skips the chunking, pool dispatch and result caching of
+        fetch_multi; single fetches are typically movingAverage()
+        followups and are answered from the last-fetch cache anyway.
+        """
+        time_info, values = self._fetch_from_last(path, start_time, end_time)
+        if time_info is not None:
+            return time_info, values
+
+        paths, renames = self._pdns_unmap_views([path])
+
+        points = max(1, min(720, int(end_time - start_time) // 10))
+        step = max(1, int(end_time - start_time) // points)
+        time_info = start_time, end_time, step
+
+        series_dict = self._retrieve_data(
+            paths, start_time, end_time, points)
+        return time_info, series_dict.get(paths[0], [])
+
     def _fetch_from_last(self, path, start_time, end_time):
         # Return cached data if this is a request triggered by movingAverage(),
         # which can be identified by an end_time equal to last start_time
@@ -380,14 +731,15 @@ class MetronomeFinder(object):
         )
 
         # Allows for keepalive
-        #session = getattr(request_session_cache, 'session', None)
-        #if session is None:
-        #    session = requests.session()
-        #    request_session_cache.session = session
-        session = requests.session()
+        session = get_session()
 
         try:
-            resp = session.get(self._metronome_url, params=params)
+            if self._use_post:
+                resp = session.post(self._metronome_url, data=params,
+                                    stream=True)
+            else:
+                resp = session.get(self._metronome_url, params=params,
+                                   stream=True)
         except requests.RequestException as e:
             log.error("Exception while fetching data: %s", str(e))
             raise
@@ -397,20 +749,31 @@ class MetronomeFinder(object):
                 '_retrieve_data: response code %s != 200', resp.status_code)
             return {}
 
-        data = load_jsonp(resp.text)
+        body = read_response_body(resp)
+        data = load_jsonp(body)
         t1 = time.time()
-        size_kb = len(resp.text) / 1024.0
+        size_kb = len(body) / 1024.0
         kbps = size_kb / (t1 - t0)
         log.debug('_retrieve_data took %.1fs for %i paths (%.1f kB; %.1f kB/s)',
                   t1 - t0, len(base_paths), size_kb, kbps)
 
+        # The response body is no longer needed; drop it before building
+        # the series lists to trim peak memory
+        del body
+
+        # Strip the timestamps with a C-level loop instead of a Python
+        # comprehension unpacking (ts, val) tuples. Membership is tested
+        # against a frozenset: 'paths' is a list and 'in' would scan it
+        # for every returned series.
+        paths_set = frozenset(paths)
+        get_value = itemgetter(1)
         series_dict = {}
         for path, series in data['raw'].items():
-            if path in paths:
-                series_dict[path] = [ val for (ts, val) in series ]
+            if path in paths_set:
+                series_dict[path] = list(map(get_value, series))
         for path, series in data['derivative'].items():
-            if path + '_dt' in paths:
-                series_dict[path + '_dt'] = [ val for (ts, val) in series ]
+            if path + '_dt' in paths_set:
+                series_dict[path + '_dt'] = list(map(get_value, series))
 
         return series_dict
 
@@ -435,16 +798,7 @@ class MetronomeReader(object):
     # noinspection PyProtectedMember
     @log_call
     def fetch(self, start_time, end_time):
-        time_info, series = \
-            self._finder.fetch_multi([Node(self.path)], start_time, end_time)
-
-        if self.path in series:
-            single_series = series[self.path]
-            #if not single_series:
-            #    return None
-            return time_info, single_series
-        else:
-            return time_info, []
+        return self._finder._fetch_one(self.path, start_time, end_time)
 
     def get_intervals(self):
         # TODO: can we return real data?